@@ -339,8 +339,8 @@ class AssetCache:
             self._remotes[spec] = remote
 
         # Determine overall existance of push or fetch remotes
-        self._has_fetch_remotes = any(remote.storage for _, remote in self._remotes.items()) and any(
-            remote.index for _, remote in self._remotes.items()
+        self._has_fetch_remotes = any(remote.storage for remote in self._remotes.values()) and any(
+            remote.index for remote in self._remotes.values()
         )
         self._has_push_remotes = any(spec.push and remote.storage for spec, remote in self._remotes.items()) and any(
             spec.push and remote.index for spec, remote in self._remotes.items()
@@ -22,15 +22,20 @@ class FastEnumType(click.Choice):
         self._enum = enum
 
         if options is None:
+            self._enum_choices = frozenset(enum)
             options = enum.values()
         else:
+            self._enum_choices = frozenset(options)
             options = [option.value for option in options]
 
         super().__init__(options)
 
     def convert(self, value, param, ctx):
         # This allows specifying default values as instances of the
-        # enum
+        # enum, valid choices are returned as is instead of round
+        # tripping through their string values
+        if value in self._enum_choices:
+            return value
         if isinstance(value, self._enum):
             value = value.value
 
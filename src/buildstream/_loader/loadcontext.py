@@ -231,7 +231,7 @@ class LoadContext:
     #    (LoadError): A CONFLICTING_JUNCTION LoadError in the case of a conflict
     #
     def assert_loaders(self):
-        for _, loaders in self._loaders.items():
+        for loaders in self._loaders.values():
             loaders.assert_loaders()
 
     # register_loader()
@@ -265,5 +265,5 @@ class LoadContext:
     #    (_ProjectInformation): A descriptive project information object
     #
     def loaded_projects(self):
-        for _, project_loaders in self._loaders.items():
+        for project_loaders in self._loaders.values():
             yield from project_loaders.loaded_projects()
@@ -153,7 +153,7 @@ class OptionPool:
     #    variables (dict): A variables dictionary
     #
     def export_variables(self, variables):
-        for _, option in self._options.items():
+        for option in self._options.values():
             if option.variable:
                 variables[option.variable] = option.get_value()
 
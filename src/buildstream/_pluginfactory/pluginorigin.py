@@ -26,15 +26,14 @@ from ..exceptions import LoadErrorReason
 #
 class PluginType(FastEnum):
 
+    _str_is_value = True
+
     # A Source plugin
     SOURCE = "source"
 
     # An Element plugin
     ELEMENT = "element"
 
-    def __str__(self):
-        return str(self.value)
-
 
 # PluginOriginType:
 #
@@ -18,6 +18,9 @@
 #        Jim MacArthur <jim.macarthur@codethink.co.uk>
 #        Benjamin Schubert <bschubert15@bloomberg.net>
 
+import sys
+
+
 # MetaFastEnum()
 #
 # This is a reemplementation of MetaEnum, in order to get a faster implementation of Enum.
@@ -29,7 +32,9 @@
 class MetaFastEnum(type):
     def __new__(mcs, name, bases, dct):
         if name == "FastEnum":
-            return type.__new__(mcs, name, bases, dct)
+            kls = type.__new__(mcs, name, bases, dct)
+            mcs.set_values(kls, {})
+            return kls
 
         assert len(bases) == 1, "Multiple inheritance with Fast enums is not currently supported."
 
@@ -43,10 +48,17 @@ class MetaFastEnum(type):
         for key, value in dct.items():
             if key.startswith("__") and key.endswith("__"):
                 dunder_values[key] = value
+            elif key == "_str_is_value":
+                # This is a class option, not an entry
+                dunder_values[key] = value
             else:
-                assert key not in parent_keys, "Overriding 'FastEnum.{}' is not allowed. ".format(key)
+                assert key not in parent_keys, f"Overriding 'FastEnum.{key}' is not allowed. "
                 normal_values[key] = value
 
+        # Unless they explicitly declare their own slots, subclasses must not
+        # add a __dict__ to the slotted FastEnum entries
+        dunder_values.setdefault("__slots__", ())
+
         kls = type.__new__(mcs, name, bases, dunder_values)
         mcs.set_values(kls, normal_values)
 
@@ -56,23 +68,59 @@ class MetaFastEnum(type):
     def set_values(mcs, kls, data):
         value_to_entry = {}
 
-        assert len(set(data.values())) == len(data.values()), "Values for {} are not unique".format(kls)
+        assert len(set(data.values())) == len(data.values()), f"Values for {kls} are not unique"
         assert len(set(type(value) for value in data.values())) <= 1, \
-            "Values of {} are of heterogeneous types".format(kls)
+            f"Values of {kls} are of heterogeneous types"
 
         for key, value in data.items():
+            # Intern string values, so that the dict lookups in FastEnum.__new__()
+            # can match keys by identity whenever the caller also holds an interned string.
+            #
+            # This is done here for every enum, so that values do not need to be
+            # interned explicitly in the enum definitions, even when they are computed
+            # rather than declared as string literals.
+            if type(value) is str:
+                value = sys.intern(value)
+
             new_value = object.__new__(kls)
             object.__setattr__(new_value, "value", value)
             object.__setattr__(new_value, "name", key)
 
+            # Precompute the string representation, this is used a lot in messages
+            if kls._str_is_value:
+                str_cache = str(value)
+            else:
+                str_cache = f"{kls.__name__}.{key}"
+            object.__setattr__(new_value, "_str_cache", str_cache)
+
+            # Entries are pickled by value, this is also precomputed as
+            # they are sent along with messages between processes
+            object.__setattr__(new_value, "_reduce_result", (kls, (value,)))
+
             type.__setattr__(kls, key, new_value)
 
             value_to_entry[value] = new_value
 
         type.__setattr__(kls, "_value_to_entry", value_to_entry)
+        type.__setattr__(kls, "_values_tuple", tuple(value_to_entry))
+
+        # Install the implementation of FastEnum.__new__() for this enum, binding the
+        # lookup into this enum's own values, to avoid resolving them on every construction.
+        #
+        # Avoid the try/except machinery here, this is called in hot code paths
+        # and very often with an instance of the enum itself.
+        def __new__(cls, value, *, _get=value_to_entry.get):
+            entry = _get(value)
+            if entry is not None:
+                return entry
+            if type(value) is cls:
+                return value
+            raise ValueError(f"Unknown enum value: {value}")
+
+        type.__setattr__(kls, "__new__", staticmethod(__new__))
 
     def __repr__(self):
-        return "<fastenum '{}'>".format(self.__name__)
+        return f"<fastenum '{self.__name__}'>"
 
     def __setattr__(self, key, value):
         raise AttributeError("Adding new values dynamically is not supported")
@@ -1004,9 +1004,9 @@ class Plugin:
             return name
 
 
-# A local table for _prefix_warning()
+# A local table for _prefix_warning(), mapping each core warning to itself
 #
-__CORE_WARNINGS = [value for name, value in CoreWarnings.__dict__.items() if not name.startswith("__")]
+__CORE_WARNINGS = {value: value for name, value in CoreWarnings.__dict__.items() if not name.startswith("__")}
 
 
 # _prefix_warning():
@@ -1021,6 +1021,8 @@ __CORE_WARNINGS = [value for name, value in CoreWarnings.__dict__.items() if not
 #    (str): A prefixed warning
 #
 def _prefix_warning(plugin, warning):
-    if any((warning is core_warning for core_warning in __CORE_WARNINGS)):
+    # Only the CoreWarnings strings themselves are core warnings, an equal
+    # string defined by a plugin is still prefixed as the plugin's own warning.
+    if __CORE_WARNINGS.get(warning) is warning:
         return warning
     return "{}:{}".format(plugin.get_kind(), warning)
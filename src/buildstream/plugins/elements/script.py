@@ -52,6 +52,8 @@ class ScriptElement(buildstream.ScriptElement):
         self.set_root_read_only(node.get_bool("root-read-only", default=False))
 
     def configure_dependencies(self, dependencies):
+        layout_add = self.layout_add
+
         for dep in dependencies:
 
             # Determine the location to stage each element, default is "/"
@@ -61,7 +63,7 @@ class ScriptElement(buildstream.ScriptElement):
                 location = dep.config.get_str("location", location)
 
             # Add each element to the layout
-            self.layout_add(dep.element, dep.path, location)
+            layout_add(dep.element, dep.path, location)
 
 
 # Plugin entry point
@@ -46,6 +46,7 @@ class ScriptElement(Element):
     __install_root = "/"
     __cwd = "/"
     __root_read_only = False
+    __run_flags = SandboxFlags.NONE
     __commands = None  # type: OrderedDict[str, List[str]]
     __layout = {}  # type: Dict[str, List[Tuple[Element, str]]]
 
@@ -110,6 +111,7 @@ class ScriptElement(Element):
            root_read_only: Whether to mark the root filesystem as read-only.
         """
         self.__root_read_only = root_read_only
+        self.__run_flags = SandboxFlags.ROOT_READ_ONLY if root_read_only else SandboxFlags.NONE
 
     def layout_add(self, element: Element, dependency_path: str, location: str) -> None:
         """Adds an element to the layout.
@@ -251,9 +253,7 @@ class ScriptElement(Element):
 
     def assemble(self, sandbox):
 
-        flags = SandboxFlags.NONE
-        if self.__root_read_only:
-            flags |= SandboxFlags.ROOT_READ_ONLY
+        flags = self.__run_flags
 
         with sandbox.batch(flags, collect=self.__install_root):
             for groupname, commands in self.__commands.items():
@@ -24,7 +24,7 @@ Foundation types
 
 """
 
-from typing import Any, Dict, List, Union, Optional
+from typing import Any, Dict, List, NamedTuple, Tuple, Union, Optional
 import os
 
 from .node import MappingNode, SequenceNode
@@ -39,54 +39,80 @@ class FastEnum(metaclass=MetaFastEnum):
     This reimplementation doesn't suffer the same problems, but also does not reimplement everything.
     """
 
-    name = None
-    """The name of the current Enum entry, same as :func:`enum.Enum.name`
-    """
+    # Entries only ever hold these attributes, using slots saves the per entry
+    # __dict__ and makes attribute access quicker.
+    __slots__ = ("name", "value", "_str_cache", "_reduce_result")
 
-    value = None
-    """The value of the current Enum entry, same as :func:`enum.Enum.value`
-    """
+    #: The name of the current Enum entry, same as :func:`enum.Enum.name`
+    name: str
+
+    #: The value of the current Enum entry, same as :func:`enum.Enum.value`
+    value: Any
+
+    # The precomputed string representation of the entry, see MetaFastEnum
+    _str_cache: str
+
+    # The precomputed result of __reduce__(), see MetaFastEnum
+    _reduce_result: Tuple[Any, Tuple[Any]]
+
+    # Internal option for the enums in BuildStream.
+    #
+    # The string representation of entries is computed once by MetaFastEnum,
+    # and is "ClassName.ENTRY" by default. Enums which set this to True use
+    # the string form of the entry values instead.
+    #
+    _str_is_value = False
 
     # A dict of all values mapping to the entries in the enum
     _value_to_entry = {}  # type: Dict[str, Any]
 
+    # A tuple of all values, in order of declaration
+    _values_tuple = ()  # type: Tuple[Any, ...]
+
     @classmethod
     def values(cls):
         """Get all the possible values for the enum.
 
         Returns:
-            list: the list of all possible values for the enum
+            tuple: the tuple of all possible values for the enum
         """
-        return cls._value_to_entry.keys()
-
-    def __new__(cls, value):
-        try:
-            return cls._value_to_entry[value]
-        except KeyError:
-            if type(value) is cls:  # pylint: disable=unidiomatic-typecheck
-                return value
-            raise ValueError("Unknown enum value: {}".format(value))
-
-    def __eq__(self, other):
-        if self.__class__ is not other.__class__:
-            raise ValueError("Unexpected comparison between {} and {}".format(self, repr(other)))
-        # Enums instances are unique, so creating an instance with the same value as another will just
-        # send back the other one, hence we can use an identity comparison, which is much faster than '=='
-        return self is other
-
-    def __ne__(self, other):
-        if self.__class__ is not other.__class__:
-            raise ValueError("Unexpected comparison between {} and {}".format(self, repr(other)))
-        return self is not other
-
-    def __hash__(self):
-        return hash(id(self))
+        return cls._values_tuple
+
+    # __new__()
+    #
+    # Looks up an entry of the enum. Entries are never created by calling
+    # the class, they are all created by MetaFastEnum along with the class.
+    #
+    # This is a declaration only: it documents the constructor of every
+    # enum. MetaFastEnum.set_values() (in _types.pyx) replaces it on every
+    # enum, including FastEnum itself, with an implementation which is
+    # bound to the values of that enum. The lookup is done as follows:
+    #
+    #  * If `value` is the value of an entry, that entry is returned
+    #  * If `value` is itself an entry of this enum, it is returned as is
+    #  * Otherwise ValueError is raised
+    #
+    # Args:
+    #    value: The value of the entry to look up, or an entry of this enum
+    #
+    # Returns:
+    #    (FastEnum): The entry of this enum
+    #
+    # Raises:
+    #    (ValueError): If `value` is not a value or an entry of this enum
+    #
+    def __new__(cls, value):  # pylint: disable=unused-argument
+        assert False, "FastEnum.__new__() is always replaced by MetaFastEnum"
+
+    # Enums instances are unique, so creating an instance with the same value as another will just
+    # send back the other one, hence we do not override __eq__(), __ne__() or __hash__(), and rely
+    # on the identity based implementations of `object` instead, which are much faster.
 
     def __str__(self):
-        return "{}.{}".format(self.__class__.__name__, self.name)
+        return self._str_cache
 
     def __reduce__(self):
-        return self.__class__, (self.value,)
+        return self._reduce_result
 
 
 class CoreWarnings:
@@ -207,18 +233,18 @@ class _KeyStrength(FastEnum):
 #
 # The components of a cache key which need to be displayed
 #
-# This is a part of Message() so it needs to be a simple serializable object.
+# This is a part of Message() so it needs to be a simple serializable object,
+# a NamedTuple keeps it immutable and free of a per instance __dict__.
 #
 # Args:
 #    full: A full hex digest cache key for an Element
 #    brief: An abbreviated hex digest cache key for an Element
 #    strict: Whether the key matches the key which would be used in strict mode
 #
-class _DisplayKey:
-    def __init__(self, full: str, brief: str, strict: bool):
-        self.full = full  # type: str
-        self.brief = brief  # type: str
-        self.strict = strict  # type: bool
+class _DisplayKey(NamedTuple):
+    full: str
+    brief: str
+    strict: bool
 
 
 # _SchedulerErrorAction()
@@ -286,6 +312,9 @@ class _SourceUriPolicy(FastEnum):
 #
 class _PipelineSelection(FastEnum):
 
+    # The values are used on the command line, use them for display as well
+    _str_is_value = True
+
     # Select only the target elements in the associated targets
     NONE = "none"
 
@@ -303,9 +332,6 @@ class _PipelineSelection(FastEnum):
     # including the targets
     RUN = "run"
 
-    def __str__(self):
-        return str(self.value)
-
 
 # _ProjectInformation()
 #
@@ -318,6 +344,8 @@ class _PipelineSelection(FastEnum):
 #    internal (list): List of project descriptions which declared this project as internal
 #
 class _ProjectInformation:
+    __slots__ = ("project", "provenance", "duplicates", "internal")
+
     def __init__(self, project, provenance_node, duplicates, internal):
         self.project = project
         self.provenance = provenance_node.get_provenance() if provenance_node else None
@@ -0,0 +1,82 @@
+import pickle
+
+import pytest
+
+from buildstream.types import FastEnum
+
+
+class Color(FastEnum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Shape(FastEnum):
+    _str_is_value = True
+
+    ROUND = "round"
+    SQUARE = "square"
+
+
+class Size(FastEnum):
+    SMALL = 1
+    LARGE = 2
+
+    def __str__(self):
+        return "size " + super().__str__()
+
+
+def test_lookup():
+    assert Color("red") is Color.RED
+    assert Color(Color.GREEN) is Color.GREEN
+    assert Color.values() == ("red", "green")
+    assert list(Color) == [Color.RED, Color.GREEN]
+
+
+@pytest.mark.parametrize("value", ["blue", 1, Shape.ROUND])
+def test_lookup_unknown_value(value):
+    with pytest.raises(ValueError):
+        Color(value)
+
+
+def test_lookup_extra_arguments():
+    with pytest.raises(TypeError):
+        Color("red", {}.get)  # pylint: disable=too-many-function-args
+
+
+def test_equality():
+    assert Color.RED == Color("red")
+    assert Color.RED != Color.GREEN
+    assert Color.RED is not Color.GREEN
+
+
+# Entries only compare equal to themselves, comparing with raw values
+# or with entries of other enums is always false.
+@pytest.mark.parametrize("other", ["red", Shape.ROUND, None])
+def test_equality_other_types(other):
+    assert Color.RED != other
+    assert not Color.RED == other  # pylint: disable=unneeded-not
+
+
+def test_hash():
+    assert hash(Color.RED) == hash(Color("red"))
+    assert {Color.RED: 1, Color.GREEN: 2}[Color("green")] == 2
+    assert len({Color.RED, Color(Color.RED), Color("red")}) == 1
+
+
+def test_str():
+    assert str(Color.RED) == "Color.RED"
+
+
+def test_str_is_value():
+    assert str(Shape.ROUND) == "round"
+    assert str(Shape.SQUARE) == "square"
+
+
+def test_str_override():
+    assert str(Size.SMALL) == "size Size.SMALL"
+    assert str(Size.LARGE) == "size Size.LARGE"
+
+
+def test_pickle():
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(Color.RED, protocol)) is Color.RED
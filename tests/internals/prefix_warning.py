@@ -0,0 +1,23 @@
+from buildstream.plugin import _prefix_warning
+from buildstream.types import CoreWarnings
+
+
+class DummyPlugin:
+    def get_kind(self):
+        return "dummy"
+
+
+def test_core_warning_not_prefixed():
+    assert _prefix_warning(DummyPlugin(), CoreWarnings.OVERLAPS) is CoreWarnings.OVERLAPS
+
+
+def test_plugin_warning_prefixed():
+    assert _prefix_warning(DummyPlugin(), "custom-warning") == "dummy:custom-warning"
+
+
+# A string equal to a core warning, which is not the core warning itself,
+# is a warning of the plugin and must be prefixed.
+def test_plugin_warning_equal_to_core_warning_prefixed():
+    warning = "".join(["unaliased", "-url"])
+    assert warning == CoreWarnings.UNALIASED_URL
+    assert _prefix_warning(DummyPlugin(), warning) == "dummy:unaliased-url"